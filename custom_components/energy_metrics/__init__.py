@@ -1,17 +1,19 @@
 """Energy Metrics Importer integration for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import AsyncExitStack
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
 
 from .const import DOMAIN, STORAGE_KEY, STORAGE_VERSION
 from .coordinator import EnergyMetricsCoordinator
 from .api import EnergyMetricsAPI
+from .storage import EnergyMetricsStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,57 +25,71 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Setting up Energy Metrics Importer integration for entry %s", entry.entry_id)
     
     try:
-        hass.data.setdefault(DOMAIN, {})
-        
-        # Create storage for historical data
-        _LOGGER.debug("Creating storage for entry %s", entry.entry_id)
-        store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
-        
-        # Create coordinator for managing data
-        _LOGGER.debug("Initializing coordinator for entry %s", entry.entry_id)
-        coordinator = EnergyMetricsCoordinator(hass, store)
-        
-        # Initialize coordinator data
-        await coordinator.async_config_entry_first_refresh()
-        
-        # Create API endpoint handler
-        _LOGGER.debug("Setting up API handler for entry %s", entry.entry_id)
-        api = EnergyMetricsAPI(hass, coordinator)
-        
-        # Store coordinator and API in hass data
-        hass.data[DOMAIN][entry.entry_id] = {
-            "coordinator": coordinator,
-            "api": api,
-            "store": store,
-        }
-        
-        # Register API endpoints
-        try:
-            await api.async_setup()
+        async with AsyncExitStack() as stack:
+            domain_data = hass.data.setdefault(DOMAIN, {})
+            
+            # Create storage for historical data
+            _LOGGER.debug("Creating storage for entry %s", entry.entry_id)
+            store = EnergyMetricsStore(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
+            
+            # Create coordinator for managing data
+            _LOGGER.debug("Initializing coordinator for entry %s", entry.entry_id)
+            coordinator = EnergyMetricsCoordinator(hass, store)
+            
+            # Create API endpoint handler
+            _LOGGER.debug("Setting up API handler for entry %s", entry.entry_id)
+            api = EnergyMetricsAPI(hass, coordinator)
+            
+            # Store coordinator and API in hass data; on failure the stack
+            # unloads any forwarded platforms, cleans up the API, writes
+            # anything received meanwhile, then removes the entry's data
+            domain_data[entry.entry_id] = {
+                "coordinator": coordinator,
+                "api": api,
+                "store": store,
+            }
+            stack.callback(domain_data.pop, entry.entry_id, None)
+            stack.push_async_callback(coordinator.async_flush)
+            stack.push_async_callback(api.async_cleanup)
+            
+            async def _async_setup_platforms() -> None:
+                """Load initial data, then forward setup to the sensor platform."""
+                await coordinator.async_config_entry_first_refresh()
+                await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+                # Home Assistant does not unload an entry whose setup failed,
+                # so the sensors must be removed here if the API fails
+                stack.push_async_callback(
+                    hass.config_entries.async_unload_platforms, entry, PLATFORMS
+                )
+            
+            # Register API endpoints concurrently with data loading and platform
+            # setup; the view only holds a reference to the coordinator, so it
+            # does not need to wait for either
+            api_result, platform_result = await asyncio.gather(
+                api.async_setup(),
+                _async_setup_platforms(),
+                return_exceptions=True,
+            )
+            
+            if isinstance(api_result, BaseException):
+                _LOGGER.error("Failed to register API endpoints for entry %s: %s", entry.entry_id, api_result)
+                raise api_result
             _LOGGER.info("API endpoints successfully registered for entry %s", entry.entry_id)
-        except Exception as err:
-            _LOGGER.error("Failed to register API endpoints for entry %s: %s", entry.entry_id, err)
-            raise
-        
-        # Forward setup to sensor platform
-        try:
-            await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+            
+            if isinstance(platform_result, BaseException):
+                _LOGGER.error("Failed to set up sensor platform for entry %s: %s", entry.entry_id, platform_result)
+                raise platform_result
             _LOGGER.info("Sensor platform setup completed for entry %s", entry.entry_id)
-        except Exception as err:
-            _LOGGER.error("Failed to set up sensor platform for entry %s: %s", entry.entry_id, err)
-            # Clean up API if sensor setup fails
-            await api.async_cleanup()
-            raise
-        
-        _LOGGER.info("Energy Metrics Importer integration successfully set up for entry %s", entry.entry_id)
-        return True
+            
+            # Setup succeeded; keep the API and data in place
+            stack.pop_all()
         
     except Exception as err:
         _LOGGER.error("Failed to set up Energy Metrics Importer for entry %s: %s", entry.entry_id, err)
-        # Clean up any partial setup
-        if entry.entry_id in hass.data.get(DOMAIN, {}):
-            hass.data[DOMAIN].pop(entry.entry_id)
         return False
+    
+    _LOGGER.info("Energy Metrics Importer integration successfully set up for entry %s", entry.entry_id)
+    return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -87,6 +103,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if unload_ok:
             # Clean up API endpoints and data
             if entry.entry_id in hass.data.get(DOMAIN, {}):
+                # Write any delayed save before the entry's data goes away
+                try:
+                    await hass.data[DOMAIN][entry.entry_id]["coordinator"].async_flush()
+                    _LOGGER.debug("Storage flushed for entry %s", entry.entry_id)
+                except Exception as err:
+                    _LOGGER.error("Error flushing storage for entry %s: %s", entry.entry_id, err)
+                
                 try:
                     api = hass.data[DOMAIN][entry.entry_id]["api"]
                     await api.async_cleanup()
@@ -1,24 +1,118 @@
 """REST API for Energy Metrics Importer."""
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
-from datetime import datetime
-from typing import Any, Dict, List
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
+import orjson
 from aiohttp import web
 from aiohttp.web_request import Request
 from aiohttp.web_response import Response
 
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
-from .const import API_ENDPOINT, DOMAIN
-from .coordinator import EnergyMetricsCoordinator
+from .const import API_ENDPOINT, DATA_VIEW, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .coordinator import EnergyMetricsCoordinator, Metric
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum accepted POST body size in bytes
+MAX_PAYLOAD_SIZE = 10 * 1024 * 1024  # 10MB
+
+# Optional numeric fields of a metric; at least one must be provided
+NUMERIC_FIELDS = ("meter_value", "average_value", "temperature")
+
+# Sentinel distinguishing a missing key from an explicit null
+_MISSING = object()
+
+# Number of distinct range queries whose results are kept between requests
+RANGE_CACHE_SIZE = 32
+
+# Responses with more metrics than this are streamed in chunks of
+# STREAM_CHUNK_SIZE instead of being serialized into a single buffer
+STREAM_THRESHOLD = 1000
+STREAM_CHUNK_SIZE = 500
+
+# Number of parsed query timestamps kept between requests
+PARSE_CACHE_SIZE = 256
+
+# Ranges ending further back than this are treated as historical and may be
+# cached by the client for one scan interval
+HISTORICAL_RANGE_AGE = timedelta(hours=1)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a response payload using orjson."""
+    return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+
+_fromisoformat = datetime.fromisoformat
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_timestamp(value: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp, falling back to Home Assistant's parser.
+
+    Results are cached because clients tend to poll with the same range
+    boundaries; datetimes are immutable, so sharing them is safe.
+    """
+    try:
+        return _fromisoformat(value)
+    except ValueError:
+        return dt_util.parse_datetime(value)
+
+
+async def _async_read_body(request: Request, limit: int) -> bytearray | None:
+    """Read the request body, returning None once it grows past limit bytes."""
+    body = bytearray()
+    async for chunk in request.content.iter_chunked(64 * 1024):
+        body += chunk
+        if len(body) > limit:
+            return None
+    return body
+
+
+def _etag(metrics: List[Dict[str, Any]]) -> str:
+    """Return a weak entity tag for a list of metrics.
+
+    The tag is weak because responses also carry a per-request timestamp, so
+    bodies with the same metrics are equivalent but not byte-identical.
+    """
+    digest = hashlib.blake2b(
+        orjson.dumps(metrics, option=orjson.OPT_NAIVE_UTC), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(etag: str, header: str | None) -> bool:
+    """Return whether an If-None-Match header matches an entity tag.
+
+    Uses weak comparison, so a tag weakened by a proxy still matches.
+    """
+    if not header:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def _unavailable_response() -> Response:
+    """Return the response for requests made while no entry is loaded."""
+    return web.json_response(
+        {"error": "Energy Metrics integration is not loaded"},
+        status=503,
+        dumps=_dumps,
+    )
+
 
 class EnergyMetricsAPI:
     """API handler for Energy Metrics endpoints."""
@@ -30,11 +124,24 @@ class EnergyMetricsAPI:
         self._view: EnergyMetricsView | None = None
 
     async def async_setup(self) -> None:
-        """Set up the API endpoints."""
+        """Set up the API endpoints.
+
+        Home Assistant cannot unregister views, so the view is registered once
+        per run and kept in hass.data; reloading an entry attaches the new
+        coordinator to the existing view.
+        """
         try:
-            self._view = EnergyMetricsView(self.coordinator)
-            self.hass.http.register_view(self._view)
-            _LOGGER.info("Energy Metrics API endpoints registered at %s", API_ENDPOINT)
+            domain_data = self.hass.data.setdefault(DOMAIN, {})
+            view = domain_data.get(DATA_VIEW)
+            if view is None:
+                view = EnergyMetricsView(self.coordinator)
+                self.hass.http.register_view(view)
+                domain_data[DATA_VIEW] = view
+                _LOGGER.info("Energy Metrics API endpoints registered at %s", API_ENDPOINT)
+            else:
+                view.async_attach(self.coordinator)
+                _LOGGER.info("Energy Metrics API endpoints at %s attached to reloaded entry", API_ENDPOINT)
+            self._view = view
         except Exception as err:
             _LOGGER.error("Failed to register API endpoints at %s: %s", API_ENDPOINT, err)
             raise
@@ -43,9 +150,12 @@ class EnergyMetricsAPI:
         """Clean up API endpoints."""
         try:
             if self._view:
-                # Home Assistant doesn't have a direct way to unregister views
-                # The view will be cleaned up when the component is unloaded
-                _LOGGER.debug("Cleaning up API view reference")
+                # Home Assistant doesn't have a direct way to unregister views,
+                # so detach this entry's coordinator; the view answers 503
+                # until an entry is set up again
+                if self._view.coordinator is self.coordinator:
+                    self._view.async_attach(None)
+                _LOGGER.debug("Detached API view from coordinator")
                 self._view = None
         except Exception as err:
             _LOGGER.error("Error during API cleanup: %s", err)
@@ -60,31 +170,60 @@ class EnergyMetricsView(HomeAssistantView):
 
     def __init__(self, coordinator: EnergyMetricsCoordinator) -> None:
         """Initialize the view."""
+        self.coordinator: EnergyMetricsCoordinator | None = coordinator
+        # (data version, metrics, etag) of the last latest-metric query
+        self._latest_cache: Tuple[Any, List[Dict[str, Any]], str] | None = None
+        # (start_time, end_time) -> (data version, metrics, etag)
+        self._range_cache: OrderedDict[
+            Tuple[str, str], Tuple[Any, List[Dict[str, Any]], str]
+        ] = OrderedDict()
+
+    @callback
+    def async_attach(self, coordinator: EnergyMetricsCoordinator | None) -> None:
+        """Serve requests from another coordinator, or from none when None."""
         self.coordinator = coordinator
+        self._latest_cache = None
+        self._range_cache.clear()
 
     async def post(self, request: Request) -> Response:
         """Handle POST requests to add energy metrics data."""
         client_ip = request.remote or "unknown"
-        _LOGGER.info("Received POST request from %s to add energy metrics", client_ip)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Received POST request from %s to add energy metrics", client_ip)
+        
+        # Keep the coordinator for the whole request even if the entry is
+        # reloaded meanwhile
+        coordinator = self.coordinator
+        if coordinator is None:
+            return _unavailable_response()
         
         try:
-            # Parse JSON data with size limit check
+            # Reject oversized payloads up front when the client declares the
+            # size, and otherwise stop reading as soon as the limit is exceeded
             content_length = request.content_length
-            if content_length and content_length > 10 * 1024 * 1024:  # 10MB limit
-                _LOGGER.warning("Request from %s rejected: payload too large (%d bytes)", client_ip, content_length)
+            body = None
+            if not content_length or content_length <= MAX_PAYLOAD_SIZE:
+                body = await _async_read_body(request, MAX_PAYLOAD_SIZE)
+            if body is None:
+                _LOGGER.warning("Request from %s rejected: payload too large (%s bytes)", client_ip, content_length or "unknown")
                 return web.json_response(
                     {"error": "Payload too large. Maximum size is 10MB."},
-                    status=413
+                    status=413,
+                    dumps=_dumps,
                 )
             
             try:
-                data = await request.json()
-                _LOGGER.debug("Successfully parsed JSON data from %s", client_ip)
-            except json.JSONDecodeError as json_err:
+                # orjson parses the raw bytes directly, skipping a UTF-8 decode
+                data = orjson.loads(body)
+                if debug:
+                    _LOGGER.debug("Successfully parsed JSON data from %s", client_ip)
+            except orjson.JSONDecodeError as json_err:
                 _LOGGER.warning("Invalid JSON from %s: %s", client_ip, json_err)
                 return web.json_response(
                     {"error": "Invalid JSON data", "details": str(json_err)},
-                    status=400
+                    status=400,
+                    dumps=_dumps,
                 )
             
             # Validate data structure
@@ -92,7 +231,8 @@ class EnergyMetricsView(HomeAssistantView):
                 _LOGGER.warning("Invalid data format from %s: expected dict, got %s", client_ip, type(data).__name__)
                 return web.json_response(
                     {"error": "Invalid data format. Expected JSON object."},
-                    status=400
+                    status=400,
+                    dumps=_dumps,
                 )
             
             # Handle both single metric and bulk metrics
@@ -104,33 +244,45 @@ class EnergyMetricsView(HomeAssistantView):
                     _LOGGER.warning("Invalid metrics format from %s: expected list, got %s", client_ip, type(data["metrics"]).__name__)
                     return web.json_response(
                         {"error": "Metrics must be a list."},
-                        status=400
+                        status=400,
+                        dumps=_dumps,
                     )
                 metrics_data = data["metrics"]
-                _LOGGER.debug("Processing %d bulk metrics from %s", len(metrics_data), client_ip)
+                if debug:
+                    _LOGGER.debug("Processing %d bulk metrics from %s", len(metrics_data), client_ip)
             elif "timestamp" in data:
                 # Single metric format
                 metrics_data = [data]
-                _LOGGER.debug("Processing single metric from %s", client_ip)
+                if debug:
+                    _LOGGER.debug("Processing single metric from %s", client_ip)
             else:
                 _LOGGER.warning("Missing required fields from %s: no 'metrics' array or 'timestamp' field", client_ip)
                 return web.json_response(
                     {"error": "Invalid data format. Expected 'metrics' array or single metric with 'timestamp'."},
-                    status=400
+                    status=400,
+                    dumps=_dumps,
                 )
             
-            # Validate each metric
+            # Validate each metric; in strict mode stop at the first invalid one
+            # instead of walking (and reporting on) the whole payload
+            strict = request.query.get("strict") in ("1", "true")
             validated_metrics = []
             validation_errors = []
             
+            # Bind loop lookups once; bulk uploads can hold thousands of metrics
+            validate = self._validate_metric
+            append = validated_metrics.append
+            warning = _LOGGER.warning
             for i, metric in enumerate(metrics_data):
-                validation_result = self._validate_metric(metric, i)
-                if validation_result["valid"]:
-                    validated_metrics.append(validation_result["metric"])
+                validated_metric, error = validate(metric, i)
+                if error is None:
+                    append(validated_metric)
                 else:
-                    error_msg = f"Invalid metric at index {i}: {validation_result['error']}"
+                    error_msg = f"Invalid metric at index {i}: {error}"
                     validation_errors.append(error_msg)
-                    _LOGGER.warning("Validation error from %s: %s", client_ip, error_msg)
+                    warning("Validation error from %s: %s", client_ip, error_msg)
+                    if strict:
+                        break
             
             # If any validation errors, return them
             if validation_errors:
@@ -141,12 +293,14 @@ class EnergyMetricsView(HomeAssistantView):
                         "total_metrics": len(metrics_data),
                         "valid_metrics": len(validated_metrics)
                     },
-                    status=400
+                    status=400,
+                    dumps=_dumps,
                 )
             
             # Add metrics to coordinator
-            _LOGGER.debug("Attempting to store %d validated metrics from %s", len(validated_metrics), client_ip)
-            success = await self.coordinator.async_add_metrics(validated_metrics)
+            if debug:
+                _LOGGER.debug("Attempting to store %d validated metrics from %s", len(validated_metrics), client_ip)
+            success = await coordinator.async_add_metrics(validated_metrics)
             
             if success:
                 _LOGGER.info("Successfully processed %d metrics from %s", len(validated_metrics), client_ip)
@@ -157,7 +311,8 @@ class EnergyMetricsView(HomeAssistantView):
                         "processed_count": len(validated_metrics),
                         "timestamp": dt_util.utcnow().isoformat()
                     },
-                    status=200
+                    status=200,
+                    dumps=_dumps,
                 )
             else:
                 _LOGGER.error("Failed to store metrics data from %s", client_ip)
@@ -166,7 +321,8 @@ class EnergyMetricsView(HomeAssistantView):
                         "error": "Failed to store metrics data",
                         "details": "See Home Assistant logs for more information"
                     },
-                    status=500
+                    status=500,
+                    dumps=_dumps,
                 )
                 
         except Exception as err:
@@ -177,13 +333,21 @@ class EnergyMetricsView(HomeAssistantView):
                     "details": "An unexpected error occurred. Check Home Assistant logs.",
                     "timestamp": dt_util.utcnow().isoformat()
                 },
-                status=500
+                status=500,
+                dumps=_dumps,
             )
 
     async def get(self, request: Request) -> Response:
         """Handle GET requests to retrieve metrics data."""
         client_ip = request.remote or "unknown"
-        _LOGGER.debug("Received GET request from %s to retrieve metrics", client_ip)
+        now = dt_util.utcnow()
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Received GET request from %s to retrieve metrics", client_ip)
+        
+        coordinator = self.coordinator
+        if coordinator is None:
+            return _unavailable_response()
         
         try:
             query_params = request.query
@@ -193,10 +357,11 @@ class EnergyMetricsView(HomeAssistantView):
             end_time_str = query_params.get("end_time")
             
             if start_time_str and end_time_str:
-                _LOGGER.debug("Range query from %s: %s to %s", client_ip, start_time_str, end_time_str)
+                if debug:
+                    _LOGGER.debug("Range query from %s: %s to %s", client_ip, start_time_str, end_time_str)
                 try:
-                    start_time = dt_util.parse_datetime(start_time_str)
-                    end_time = dt_util.parse_datetime(end_time_str)
+                    start_time = _parse_timestamp(start_time_str)
+                    end_time = _parse_timestamp(end_time_str)
                     
                     if not start_time or not end_time:
                         _LOGGER.warning("Invalid datetime format from %s: start=%s, end=%s", client_ip, start_time_str, end_time_str)
@@ -209,11 +374,26 @@ class EnergyMetricsView(HomeAssistantView):
                                     "2024-01-01T10:00:00+00:00"
                                 ]
                             },
-                            status=400
+                            status=400,
+                            dumps=_dumps,
                         )
                     
-                    metrics = await self.coordinator.async_get_metrics_range(start_time, end_time)
-                    _LOGGER.debug("Retrieved %d metrics for range query from %s", len(metrics), client_ip)
+                    metrics, etag = await self._async_get_range_cached(
+                        coordinator, start_time_str, end_time_str, start_time, end_time
+                    )
+                    if debug:
+                        _LOGGER.debug("Retrieved %d metrics for range query from %s", len(metrics), client_ip)
+                    
+                    if dt_util.as_utc(end_time) < now - HISTORICAL_RANGE_AGE:
+                        cache_control = f"private, max-age={DEFAULT_SCAN_INTERVAL}"
+                    else:
+                        cache_control = "private, no-cache"
+                    headers = {"ETag": etag, "Cache-Control": cache_control}
+                    
+                    if _etag_matches(etag, request.headers.get("If-None-Match")):
+                        if debug:
+                            _LOGGER.debug("Range query from %s not modified", client_ip)
+                        return web.Response(status=304, headers=headers)
                     
                 except Exception as datetime_err:
                     _LOGGER.warning("Datetime parsing error from %s: %s", client_ip, datetime_err)
@@ -224,7 +404,8 @@ class EnergyMetricsView(HomeAssistantView):
                             "provided_start": start_time_str,
                             "provided_end": end_time_str
                         },
-                        status=400
+                        status=400,
+                        dumps=_dumps,
                     )
             elif start_time_str or end_time_str:
                 # Only one time parameter provided
@@ -235,20 +416,28 @@ class EnergyMetricsView(HomeAssistantView):
                         "provided_start": start_time_str,
                         "provided_end": end_time_str
                     },
-                    status=400
+                    status=400,
+                    dumps=_dumps,
                 )
             else:
                 # Get latest metric
-                _LOGGER.debug("Latest metric query from %s", client_ip)
-                latest_metric = await self.coordinator.async_get_latest_metrics()
-                metrics = [latest_metric] if latest_metric else []
-                _LOGGER.debug("Retrieved %d metrics for latest query from %s", len(metrics), client_ip)
+                if debug:
+                    _LOGGER.debug("Latest metric query from %s", client_ip)
+                metrics, etag = await self._async_get_latest_cached(coordinator)
+                if debug:
+                    _LOGGER.debug("Retrieved %d metrics for latest query from %s", len(metrics), client_ip)
+                headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+                
+                if _etag_matches(etag, request.headers.get("If-None-Match")):
+                    if debug:
+                        _LOGGER.debug("Latest metric query from %s not modified", client_ip)
+                    return web.Response(status=304, headers=headers)
             
             response_data = {
                 "success": True,
                 "metrics": metrics,
                 "count": len(metrics),
-                "timestamp": dt_util.utcnow().isoformat()
+                "timestamp": now.isoformat()
             }
             
             # Add query info to response for debugging
@@ -261,7 +450,17 @@ class EnergyMetricsView(HomeAssistantView):
             else:
                 response_data["query"] = {"type": "latest"}
             
-            return web.json_response(response_data, status=200)
+            # Large result sets are streamed in chunks rather than serialized
+            # into a single body up front
+            if len(metrics) > STREAM_THRESHOLD:
+                return await self._async_stream_response(request, response_data, headers)
+            
+            return web.Response(
+                body=orjson.dumps(response_data, option=orjson.OPT_NAIVE_UTC),
+                status=200,
+                content_type="application/json",
+                headers=headers,
+            )
             
         except Exception as err:
             _LOGGER.error("Unexpected error retrieving metrics for %s: %s", client_ip, err, exc_info=True)
@@ -269,46 +468,135 @@ class EnergyMetricsView(HomeAssistantView):
                 {
                     "error": "Internal server error",
                     "details": "An unexpected error occurred. Check Home Assistant logs.",
-                    "timestamp": dt_util.utcnow().isoformat()
+                    "timestamp": now.isoformat()
                 },
-                status=500
+                status=500,
+                dumps=_dumps,
             )
 
-    def _validate_metric(self, metric: Dict[str, Any], index: int) -> Dict[str, Any]:
-        """Validate a single metric entry."""
-        if not isinstance(metric, dict):
-            return {"valid": False, "error": "Metric must be an object"}
+    async def _async_stream_response(
+        self,
+        request: Request,
+        response_data: Dict[str, Any],
+        headers: Dict[str, str] | None,
+    ) -> web.StreamResponse:
+        """Write a metrics response incrementally, one chunk of metrics at a time."""
+        metrics = response_data.pop("metrics")
+        response = web.StreamResponse(status=200, headers=headers)
+        response.content_type = "application/json"
+        await response.prepare(request)
         
-        required_fields = ["timestamp"]
-        for field in required_fields:
-            if field not in metric:
-                return {"valid": False, "error": f"Missing required field: {field}"}
+        await response.write(b'{"success":true,"metrics":[')
+        for start in range(0, len(metrics), STREAM_CHUNK_SIZE):
+            # Strip the surrounding brackets so chunks join into one array
+            chunk = orjson.dumps(
+                metrics[start:start + STREAM_CHUNK_SIZE], option=orjson.OPT_NAIVE_UTC
+            )[1:-1]
+            await response.write(b"," + chunk if start else chunk)
+        
+        # Remaining fields (count, timestamp, query) close the object
+        del response_data["success"]
+        trailer = orjson.dumps(response_data, option=orjson.OPT_NAIVE_UTC)
+        await response.write(b"]," + trailer[1:])
+        await response.write_eof()
+        return response
+
+    @staticmethod
+    def _data_version(coordinator: EnergyMetricsCoordinator) -> Any:
+        """Return a value that changes whenever the stored metrics change."""
+        data = coordinator.data
+        # The coordinator is part of the version so results cached for a
+        # request still in flight across a reload never match the new one
+        return (coordinator, data.get("last_updated") if data else None)
+
+    async def _async_get_latest_cached(
+        self, coordinator: EnergyMetricsCoordinator
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Return the latest metric and its ETag, reusing an unchanged result."""
+        version = self._data_version(coordinator)
+        cached = self._latest_cache
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        
+        latest_metric = await coordinator.async_get_latest_metrics()
+        metrics = [latest_metric] if latest_metric else []
+        etag = _etag(metrics)
+        self._latest_cache = (version, metrics, etag)
+        return metrics, etag
+
+    async def _async_get_range_cached(
+        self,
+        coordinator: EnergyMetricsCoordinator,
+        start_time_str: str,
+        end_time_str: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Return metrics and their ETag for a range, reusing unchanged results."""
+        cache_key = (start_time_str, end_time_str)
+        version = self._data_version(coordinator)
+        
+        cached = self._range_cache.get(cache_key)
+        if cached is not None and cached[0] == version:
+            self._range_cache.move_to_end(cache_key)
+            return cached[1], cached[2]
+        
+        metrics = await coordinator.async_get_metrics_range(start_time, end_time)
+        etag = _etag(metrics)
+        
+        self._range_cache[cache_key] = (version, metrics, etag)
+        if len(self._range_cache) > RANGE_CACHE_SIZE:
+            self._range_cache.popitem(last=False)
+        return metrics, etag
+
+    def _validate_metric(
+        self, metric: Dict[str, Any], index: int
+    ) -> Tuple[Metric | None, str | None]:
+        """Validate a single metric entry.
+
+        Returns a ``(metric, error)`` pair; exactly one of the two is ``None``.
+        The parsed request dict is left untouched.
+        """
+        if not isinstance(metric, dict):
+            return None, "Metric must be an object"
         
         # Validate timestamp
-        timestamp = metric.get("timestamp")
-        if isinstance(timestamp, str):
+        if (timestamp := metric.get("timestamp", _MISSING)) is _MISSING:
+            return None, "Missing required field: timestamp"
+        # JSON payloads always carry string timestamps, so parse first and
+        # only inspect the type when fromisoformat rejects the value
+        try:
+            timestamp = _fromisoformat(timestamp)
+        except TypeError:
+            if not isinstance(timestamp, datetime):
+                return None, "Timestamp must be a datetime string or object"
+        except ValueError:
             try:
-                parsed_timestamp = dt_util.parse_datetime(timestamp)
-                if not parsed_timestamp:
-                    return {"valid": False, "error": "Invalid timestamp format"}
-                metric["timestamp"] = parsed_timestamp
+                timestamp = dt_util.parse_datetime(timestamp)
             except Exception:
-                return {"valid": False, "error": "Invalid timestamp format"}
-        elif not isinstance(timestamp, datetime):
-            return {"valid": False, "error": "Timestamp must be a datetime string or object"}
+                timestamp = None
+            if not timestamp:
+                return None, "Invalid timestamp format"
         
-        # Validate numeric fields (optional but must be numeric if present)
-        numeric_fields = ["meter_value", "average_value", "temperature"]
-        for field in numeric_fields:
-            if field in metric and metric[field] is not None:
+        # Validate numeric fields (optional but must be numeric if present);
+        # the field-by-field walk only runs to report which field failed
+        get = metric.get
+        try:
+            values = [
+                None if (value := get(field)) is None else float(value)
+                for field in NUMERIC_FIELDS
+            ]
+        except (ValueError, TypeError):
+            for field in NUMERIC_FIELDS:
                 try:
-                    metric[field] = float(metric[field])
+                    if (value := get(field)) is not None:
+                        float(value)
                 except (ValueError, TypeError):
-                    return {"valid": False, "error": f"Field '{field}' must be numeric"}
+                    return None, f"Field '{field}' must be numeric"
+            raise
         
         # Ensure at least one data field is present
-        data_fields = ["meter_value", "average_value", "temperature"]
-        if not any(field in metric and metric[field] is not None for field in data_fields):
-            return {"valid": False, "error": "At least one data field (meter_value, average_value, temperature) must be provided"}
+        if values.count(None) == len(NUMERIC_FIELDS):
+            return None, "At least one data field (meter_value, average_value, temperature) must be provided"
         
-        return {"valid": True, "metric": metric}
\ No newline at end of file
+        return Metric(timestamp, *values), None
@@ -9,7 +9,6 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.exceptions import HomeAssistantError
 
 from .const import DOMAIN
 
@@ -17,8 +16,12 @@ _LOGGER = logging.getLogger(__name__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required("name", default="Energy Metrics"): str,
-        vol.Optional("description", default="Energy metrics from vendor export"): str,
+        vol.Required("name", default="Energy Metrics"): vol.All(
+            str, vol.Strip, vol.Length(min=1, max=100)
+        ),
+        vol.Optional("description", default="Energy metrics from vendor export"): vol.All(
+            str, vol.Strip, vol.Length(max=500)
+        ),
     }
 )
 
@@ -38,14 +41,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.info("Processing config flow input: %s", {k: v for k, v in user_input.items() if k != "password"})
             
             try:
+                # Flows started programmatically skip the form, so apply the
+                # schema here as well
+                user_input = STEP_USER_DATA_SCHEMA(user_input)
                 info = await validate_input(self.hass, user_input)
                 _LOGGER.info("Config validation successful for: %s", info["title"])
-            except CannotConnect as err:
-                _LOGGER.error("Cannot connect during config flow: %s", err)
-                errors["base"] = "cannot_connect"
-            except InvalidAuth as err:
-                _LOGGER.error("Invalid auth during config flow: %s", err)
-                errors["base"] = "invalid_auth"
+            except vol.Invalid as err:
+                _LOGGER.error("Invalid config flow input: %s", err)
+                errors["base"] = "invalid_input"
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception during config flow: %s", err)
                 errors["base"] = "unknown"
@@ -58,8 +61,23 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def async_step_import(self, import_info: Dict[str, Any]) -> FlowResult:
-        """Handle import from configuration.yaml."""
-        return await self.async_step_user(import_info)
+        """Handle import from configuration.yaml.
+
+        Imported data never goes through a form, so it is validated directly
+        and the entry is created without the user step's form handling.
+        """
+        try:
+            import_info = STEP_USER_DATA_SCHEMA(import_info)
+            info = await validate_input(self.hass, import_info)
+        except vol.Invalid as err:
+            _LOGGER.error("Invalid configuration.yaml import: %s", err)
+            return self.async_abort(reason="invalid_config")
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected exception during import: %s", err)
+            return self.async_abort(reason="unknown")
+
+        _LOGGER.info("Creating config entry for Energy Metrics from import: %s", info["title"])
+        return self.async_create_entry(title=info["title"], data=import_info)
 
 
 async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -69,41 +87,11 @@ async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str,
     """
     _LOGGER.debug("Validating config input: %s", data)
     
-    try:
-        # Validate that the name is not empty
-        name = data.get("name", "").strip()
-        if not name:
-            _LOGGER.error("Config validation failed: name is empty")
-            raise InvalidAuth("Name cannot be empty")
-        
-        # Validate name length
-        if len(name) > 100:
-            _LOGGER.error("Config validation failed: name too long (%d characters)", len(name))
-            raise InvalidAuth("Name cannot be longer than 100 characters")
-        
-        # Validate description if provided
-        description = data.get("description", "").strip()
-        if description and len(description) > 500:
-            _LOGGER.error("Config validation failed: description too long (%d characters)", len(description))
-            raise InvalidAuth("Description cannot be longer than 500 characters")
-
-        # For this integration, we don't need to connect to external services
-        # The validation is mainly for ensuring required fields are present
-        
-        _LOGGER.debug("Config validation successful for name: %s", name)
-        return {"title": name}
-        
-    except (InvalidAuth, CannotConnect):
-        # Re-raise known validation errors
-        raise
-    except Exception as err:
-        _LOGGER.error("Unexpected error during config validation: %s", err)
-        raise InvalidAuth(f"Validation failed: {str(err)}")
-
-
-class CannotConnect(HomeAssistantError):
-    """Error to indicate we cannot connect."""
+    # STEP_USER_DATA_SCHEMA strips and length-checks the fields, so the
+    # name is never empty here
+    name = data["name"]
 
-
-class InvalidAuth(HomeAssistantError):
-    """Error to indicate there is invalid auth."""
\ No newline at end of file
+    # For this integration, we don't need to connect to external services
+    
+    _LOGGER.debug("Config validation successful for name: %s", name)
+    return {"title": name}
@@ -2,10 +2,12 @@
 
 DOMAIN = "energy_metrics"
 STORAGE_KEY = "energy_metrics_data"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+SAVE_DELAY = 10  # seconds to coalesce writes before flushing to disk
 
 # API endpoint paths
 API_ENDPOINT = "/api/energy_metrics"
+DATA_VIEW = "view"  # hass.data[DOMAIN] key of the API view shared by all entries
 
 # Default configuration
 DEFAULT_NAME = "Energy Metrics"
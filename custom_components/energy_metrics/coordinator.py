@@ -3,19 +3,149 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 from homeassistant.components.recorder.statistics import async_add_external_statistics
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, SAVE_DELAY
+from .storage import columns_to_metrics, metrics_to_columns
 
 _LOGGER = logging.getLogger(__name__)
 
+# Batches larger than this are prepared in the executor
+EXECUTOR_BATCH_THRESHOLD = 500
+
+# External statistics metadata, shared by every import
+_ENERGY_METADATA = {
+    "source": DOMAIN,
+    "statistic_id": f"{DOMAIN}:energy_total",
+    "unit_of_measurement": "kWh",
+    "has_mean": False,
+    "has_sum": True,
+    "name": "Energy Consumption Total",
+}
+_TEMP_METADATA = {
+    "source": DOMAIN,
+    "statistic_id": f"{DOMAIN}:temperature",
+    "unit_of_measurement": "°F",
+    "has_mean": True,
+    "has_sum": False,
+    "name": "Temperature",
+}
+
+
+class Metric(NamedTuple):
+    """A single validated energy metrics reading."""
+
+    timestamp: datetime
+    meter_value: float | None
+    average_value: float | None
+    temperature: float | None
+
+
+def _epoch(timestamp: datetime) -> float:
+    """Return the POSIX timestamp of a datetime, treating naive values as local time."""
+    return dt_util.as_utc(timestamp).timestamp()
+
+
+class _PreparedBatch(NamedTuple):
+    """Per-record work for a batch, done before touching stored data."""
+
+    # (timestamp_key, epoch, meter_value, average_value, temperature) per metric
+    entries: List[Tuple[str, float, float | None, float | None, float | None]]
+    energy_statistics: List[Dict[str, Any]]
+    temperature_statistics: List[Dict[str, Any]]
+    error_count: int
+    # True when every entry is strictly newer than the one before it
+    increasing: bool
+
+
+def _prepare_batch(metrics_data: List[Metric]) -> _PreparedBatch:
+    """Normalize timestamps and build statistics rows for a batch of metrics.
+
+    This only reads its input, so large batches can run it in the executor.
+    """
+    entries = []
+    error_count = 0
+    
+    # Statistics rows are built in the same pass, paired with the exact
+    # reading time; they only need sorting if the batch is out of order
+    energy_rows: List[Tuple[float, Dict[str, Any]]] = []
+    temperature_rows: List[Tuple[float, Dict[str, Any]]] = []
+    last_epoch = float("-inf")
+    in_order = True
+    increasing = True
+    
+    for i, metric in enumerate(metrics_data):
+        timestamp = metric.timestamp
+        if not isinstance(timestamp, (str, datetime)):
+            _LOGGER.warning("Metric at index %d missing timestamp: %s", i, metric)
+            error_count += 1
+            continue
+        
+        # Parse timestamp if it's a string
+        if isinstance(timestamp, str):
+            timestamp = dt_util.parse_datetime(timestamp)
+            if not timestamp:
+                _LOGGER.error("Failed to parse timestamp at index %d: %s", i, metric.timestamp)
+                error_count += 1
+                continue
+        
+        # Convert to ISO string for consistent storage
+        timestamp_key = timestamp.isoformat()
+        epoch = _epoch(timestamp)
+        meter_value = metric.meter_value
+        average_value = metric.average_value
+        temperature = metric.temperature
+        
+        # Log if all data fields are None
+        if meter_value is None and average_value is None and temperature is None:
+            _LOGGER.warning("Metric at index %d has no data values (meter_value, average_value, temperature all None)", i)
+        
+        entries.append((timestamp_key, epoch, meter_value, average_value, temperature))
+        
+        # Round timestamp down to the UTC hour (Home Assistant statistics
+        # requirement)
+        if meter_value is not None or temperature is not None:
+            hour_start = datetime.fromtimestamp(epoch - epoch % 3600, tz=dt_util.UTC)
+            if meter_value is not None:
+                # Cumulative reading as both sum and state
+                energy_rows.append(
+                    (epoch, {"start": hour_start, "sum": meter_value, "state": meter_value})
+                )
+            if temperature is not None:
+                # A single reading per point, so it is the mean, min and
+                # max alike
+                temperature_rows.append(
+                    (epoch, {"start": hour_start, "mean": temperature, "min": temperature, "max": temperature})
+                )
+        
+        if epoch <= last_epoch:
+            increasing = False
+            if epoch < last_epoch:
+                in_order = False
+        last_epoch = epoch
+    
+    if not in_order:
+        # Sort on the exact reading time rather than the hour start: the
+        # recorder keeps the last row it receives for an hour, which must be
+        # the latest reading within it
+        energy_rows.sort(key=itemgetter(0))
+        temperature_rows.sort(key=itemgetter(0))
+    energy_statistics = [row for _, row in energy_rows]
+    temperature_statistics = [row for _, row in temperature_rows]
+    
+    return _PreparedBatch(
+        entries, energy_statistics, temperature_statistics, error_count, increasing
+    )
+
 
 class EnergyMetricsCoordinator(DataUpdateCoordinator):
     """Class to manage fetching and storing energy metrics data."""
@@ -30,28 +160,87 @@ class EnergyMetricsCoordinator(DataUpdateCoordinator):
         )
         self.store = store
         self._data: Dict[str, Any] = {}
+        self._loaded = False
+        # Set while a delayed save is scheduled but not yet flushed
+        self._dirty = False
         self._lock = asyncio.Lock()
+        # Storage keys ordered by time, with their POSIX timestamps in a
+        # parallel list so latest/range lookups can bisect instead of scanning
+        self._index_epochs: List[float] = []
+        self._index_keys: List[str] = []
+
+    async def _async_ensure_loaded(self) -> None:
+        """Load data from storage the first time it is needed.
+
+        While the entry is loaded every write goes through this coordinator:
+        the shared API view is attached to it on setup and detached on unload,
+        and pending saves are flushed before a reload reads storage again. So
+        after the initial load the in-memory copy is authoritative.
+        """
+        if self._loaded:
+            return
+        _LOGGER.debug("Loading data from storage")
+        stored_data = await self.store.async_load()
+        if stored_data:
+            self._data = columns_to_metrics(stored_data)
+            _LOGGER.debug("Loaded %d metrics from storage", len(self._data["metrics"]))
+        else:
+            _LOGGER.debug("No stored data found, initializing empty dataset")
+            self._data = {"metrics": {}}
+        self._rebuild_index()
+        self._loaded = True
+
+    async def _async_ensure_loaded_for_read(self) -> None:
+        """Make sure data is loaded before a read without holding the lock.
+
+        Once loaded, reads need no lock: writers update the data and index
+        without awaiting in between, so a read running on the event loop
+        always sees a consistent snapshot. The lock is only taken for the
+        initial load so it cannot race a concurrent writer.
+        """
+        if not self._loaded:
+            async with self._lock:
+                await self._async_ensure_loaded()
+
+    def _rebuild_index(self) -> None:
+        """Build the time-ordered index from the stored metrics."""
+        entries = []
+        for timestamp_key in self._data["metrics"]:
+            timestamp = dt_util.parse_datetime(timestamp_key)
+            if timestamp is None:
+                _LOGGER.warning("Ignoring stored metric with unparseable timestamp %s", timestamp_key)
+                continue
+            entries.append((_epoch(timestamp), timestamp_key))
+        entries.sort()
+        self._index_epochs = [epoch for epoch, _ in entries]
+        self._index_keys = [timestamp_key for _, timestamp_key in entries]
+
+    def _index_insert(self, epoch: float, timestamp_key: str) -> None:
+        """Insert a new storage key into the time-ordered index."""
+        position = bisect_right(self._index_epochs, epoch)
+        self._index_epochs.insert(position, epoch)
+        self._index_keys.insert(position, timestamp_key)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to persist for a delayed save."""
+        # The store calls this when it writes, so everything scheduled so far
+        # is on its way to disk
+        self._dirty = False
+        return metrics_to_columns(self._data)
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data from storage."""
         try:
             async with self._lock:
-                _LOGGER.debug("Loading data from storage")
-                stored_data = await self.store.async_load()
-                if stored_data:
-                    self._data = stored_data
-                    metrics_count = len(stored_data.get("metrics", {}))
-                    _LOGGER.debug("Loaded %d metrics from storage", metrics_count)
-                else:
-                    _LOGGER.debug("No stored data found, initializing empty dataset")
-                    self._data = {}
+                await self._async_ensure_loaded()
                 return self._data
         except Exception as err:
             _LOGGER.error("Failed to load data from storage: %s", err)
             self.last_update_success = False
             raise
 
-    async def async_add_metrics(self, metrics_data: List[Dict[str, Any]]) -> bool:
+    async def async_add_metrics(self, metrics_data: List[Metric]) -> bool:
         """Add or update energy metrics data."""
         if not metrics_data:
             _LOGGER.warning("No metrics data provided")
@@ -62,98 +251,100 @@ class EnergyMetricsCoordinator(DataUpdateCoordinator):
         async with self._lock:
             try:
                 # Load existing data
-                stored_data = await self.store.async_load() or {}
-                metrics = stored_data.get("metrics", {})
+                await self._async_ensure_loaded()
+                stored_data = self._data
+                metrics = stored_data["metrics"]
                 initial_count = len(metrics)
                 
+                # Batches above the threshold are prepared in the executor so
+                # the per-record work does not stall the event loop
+                if len(metrics_data) > EXECUTOR_BATCH_THRESHOLD:
+                    batch = await self.hass.async_add_executor_job(_prepare_batch, metrics_data)
+                else:
+                    batch = _prepare_batch(metrics_data)
+                
                 updated = False
-                processed_count = 0
-                error_count = 0
+                processed_count = len(batch.entries)
+                error_count = batch.error_count
                 
-                for i, metric in enumerate(metrics_data):
-                    try:
-                        timestamp = metric.get("timestamp")
-                        if not timestamp:
-                            _LOGGER.warning("Metric at index %d missing timestamp: %s", i, metric)
-                            error_count += 1
-                            continue
-                        
-                        # Parse timestamp if it's a string
-                        if isinstance(timestamp, str):
-                            try:
-                                timestamp = dt_util.parse_datetime(timestamp)
-                                if not timestamp:
-                                    _LOGGER.error("Failed to parse timestamp at index %d: %s", i, metric.get("timestamp"))
-                                    error_count += 1
-                                    continue
-                            except Exception as parse_err:
-                                _LOGGER.error("Invalid timestamp format at index %d (%s): %s", i, metric.get("timestamp"), parse_err)
-                                error_count += 1
-                                continue
-                        
-                        # Convert to ISO string for consistent storage
-                        timestamp_key = timestamp.isoformat()
-                        
-                        # Validate data fields
-                        meter_value = metric.get("meter_value")
-                        average_value = metric.get("average_value")
-                        temperature = metric.get("temperature")
-                        
-                        # Log if all data fields are None
-                        if all(v is None for v in [meter_value, average_value, temperature]):
-                            _LOGGER.warning("Metric at index %d has no data values (meter_value, average_value, temperature all None)", i)
-                        
-                        # Store or update the metric (check if different for efficiency)
-                        new_metric_data = {
+                # Every metric in a batch shares one creation time, which is
+                # also recorded as the last update time
+                now_iso = dt_util.utcnow().isoformat()
+                
+                # Storage and index are only mutated here, on the event loop,
+                # with no await in between so lock-free readers stay consistent
+                entries = batch.entries
+                index_epochs = self._index_epochs
+                if entries and batch.increasing and (
+                    not index_epochs or entries[0][1] > index_epochs[-1]
+                ):
+                    # Append-only batch, the usual backfill shape: every entry
+                    # is newer than anything stored, so none can already exist
+                    # and the index can be extended at the tail
+                    for timestamp_key, epoch, meter_value, average_value, temperature in entries:
+                        metrics[timestamp_key] = {
                             "timestamp": timestamp_key,
                             "meter_value": meter_value,
                             "average_value": average_value,
                             "temperature": temperature,
-                            "created_at": dt_util.utcnow().isoformat(),
+                            "created_at": now_iso,
                         }
-                        
-                        # Check if this is a new entry or an update
-                        is_new = timestamp_key not in metrics
-                        is_different = not is_new and metrics[timestamp_key] != new_metric_data
-                        
+                    index_epochs.extend([entry[1] for entry in entries])
+                    self._index_keys.extend([entry[0] for entry in entries])
+                    updated = True
+                    _LOGGER.debug("Appended %d new metrics after %s", len(entries), entries[0][0])
+                else:
+                    # Checked once so the per-record debug logs cost nothing
+                    # when debug logging is off
+                    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+                    for timestamp_key, epoch, meter_value, average_value, temperature in entries:
+                        # Check if this is a new entry or an update; only the
+                        # value fields are compared since created_at always
+                        # differs between batches
+                        existing = metrics.get(timestamp_key)
+                        is_new = existing is None
+                        is_different = not is_new and (
+                            existing["meter_value"], existing["average_value"], existing["temperature"]
+                        ) != (meter_value, average_value, temperature)
+                    
+                        # Store or update the metric
                         if is_new or is_different:
-                            metrics[timestamp_key] = new_metric_data
-                            updated = True
+                            metrics[timestamp_key] = {
+                                "timestamp": timestamp_key,
+                                "meter_value": meter_value,
+                                "average_value": average_value,
+                                "temperature": temperature,
+                                "created_at": now_iso,
+                            }
                             if is_new:
-                                _LOGGER.debug("Added new metric for timestamp %s", timestamp_key)
-                            else:
-                                _LOGGER.debug("Updated existing metric for timestamp %s", timestamp_key)
-                        
-                        processed_count += 1
-                        
-                    except Exception as metric_err:
-                        _LOGGER.error("Error processing metric at index %d: %s. Metric data: %s", i, metric_err, metric)
-                        error_count += 1
-                        continue
+                                self._index_insert(epoch, timestamp_key)
+                            updated = True
+                            if debug:
+                                if is_new:
+                                    _LOGGER.debug("Added new metric for timestamp %s", timestamp_key)
+                                else:
+                                    _LOGGER.debug("Updated existing metric for timestamp %s", timestamp_key)
                 
                 if updated:
-                    try:
-                        # Save updated data
-                        stored_data["metrics"] = metrics
-                        stored_data["last_updated"] = dt_util.utcnow().isoformat()
-                        await self.store.async_save(stored_data)
-                        
-                        final_count = len(metrics)
-                        _LOGGER.info("Storage updated successfully. Metrics count: %d -> %d. Processed: %d, Errors: %d", 
-                                   initial_count, final_count, processed_count, error_count)
-                        
-                        # Update coordinator data
-                        self._data = stored_data
-                        
-                        # Import new/updated metrics to Home Assistant statistics system
-                        await self._import_metrics_to_statistics(metrics_data)
-                        
-                        # Notify listeners
-                        self.async_set_updated_data(self._data)
-                        
-                    except Exception as save_err:
-                        _LOGGER.error("Failed to save metrics to storage: %s", save_err)
-                        return False
+                    # Schedule a save; bursts of batches are coalesced into a
+                    # single write by the store, and async_flush writes any
+                    # pending save when the entry is unloaded
+                    stored_data["metrics"] = metrics
+                    stored_data["last_updated"] = now_iso
+                    self.store.async_delay_save(self._data_to_save, SAVE_DELAY)
+                    self._dirty = True
+                    
+                    final_count = len(metrics)
+                    _LOGGER.info("Storage updated successfully. Metrics count: %d -> %d. Processed: %d, Errors: %d", 
+                               initial_count, final_count, processed_count, error_count)
+                    
+                    # Import new/updated metrics to Home Assistant statistics system
+                    await self._import_metrics_to_statistics(
+                        batch.energy_statistics, batch.temperature_statistics
+                    )
+                    
+                    # Notify listeners
+                    self.async_set_updated_data(self._data)
                 else:
                     _LOGGER.info("No metrics needed updating. Processed: %d, Errors: %d", processed_count, error_count)
                 
@@ -164,26 +355,47 @@ class EnergyMetricsCoordinator(DataUpdateCoordinator):
                 _LOGGER.error("Critical error in async_add_metrics: %s", err, exc_info=True)
                 return False
 
+    async def async_flush(self) -> None:
+        """Write a pending delayed save to storage now.
+
+        Saves are delayed to coalesce bursts of batches; this must run before
+        the entry is unloaded, or a reload inside the delay would read the
+        older file and later overwrite the pending batch. Nothing is written
+        when no save is pending, so an unchanged copy never replaces the file.
+        """
+        async with self._lock:
+            if not self._dirty:
+                return
+            await self.store.async_save(self._data_to_save())
+            _LOGGER.debug("Flushed %d metrics to storage", len(self._data["metrics"]))
+
+    @property
+    def latest_metric(self) -> Optional[Dict[str, Any]]:
+        """Return the most recent loaded metric, or None if there is none."""
+        # The index is time-ordered, so the most recent entry is last
+        if not self._index_keys:
+            return None
+        return self._data["metrics"][self._index_keys[-1]]
+
+    @property
+    def latest_epoch(self) -> Optional[float]:
+        """Return the POSIX timestamp of the most recent metric, or None."""
+        if not self._index_epochs:
+            return None
+        return self._index_epochs[-1]
+
     async def async_get_latest_metrics(self) -> Optional[Dict[str, Any]]:
         """Get the latest metric entry."""
         try:
-            async with self._lock:
-                stored_data = await self.store.async_load() or {}
-                metrics = stored_data.get("metrics", {})
-                
-                if not metrics:
-                    _LOGGER.debug("No metrics found in storage")
-                    return None
-                
-                try:
-                    # Get the most recent entry
-                    latest_timestamp = max(metrics.keys())
-                    latest_metric = metrics[latest_timestamp]
-                    _LOGGER.debug("Retrieved latest metric for timestamp %s", latest_timestamp)
-                    return latest_metric
-                except ValueError as err:
-                    _LOGGER.error("Error finding latest metric (empty metrics?): %s", err)
-                    return None
+            await self._async_ensure_loaded_for_read()
+            
+            latest_metric = self.latest_metric
+            if latest_metric is None:
+                _LOGGER.debug("No metrics found in storage")
+                return None
+            
+            _LOGGER.debug("Retrieved latest metric for timestamp %s", latest_metric["timestamp"])
+            return latest_metric
                     
         except Exception as err:
             _LOGGER.error("Error retrieving latest metrics: %s", err)
@@ -192,7 +404,7 @@ class EnergyMetricsCoordinator(DataUpdateCoordinator):
     async def async_get_metrics_range(
         self, start_time: datetime, end_time: datetime
     ) -> List[Dict[str, Any]]:
-        """Get metrics within a time range."""
+        """Get metrics within a time range, ordered by timestamp."""
         if start_time > end_time:
             _LOGGER.error("Invalid time range: start_time (%s) is after end_time (%s)", start_time, end_time)
             return []
@@ -200,122 +412,43 @@ class EnergyMetricsCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("Retrieving metrics from %s to %s", start_time, end_time)
         
         try:
-            async with self._lock:
-                stored_data = await self.store.async_load() or {}
-                metrics = stored_data.get("metrics", {})
-                
-                if not metrics:
-                    _LOGGER.debug("No metrics found in storage for range query")
-                    return []
-                
-                filtered_metrics = []
-                parse_errors = 0
-                
-                for timestamp_str, metric in metrics.items():
-                    try:
-                        metric_time = dt_util.parse_datetime(timestamp_str)
-                        if metric_time and start_time <= metric_time <= end_time:
-                            filtered_metrics.append(metric)
-                    except Exception as err:
-                        _LOGGER.error("Error parsing timestamp %s: %s", timestamp_str, err)
-                        parse_errors += 1
-                        continue
-                
-                if parse_errors > 0:
-                    _LOGGER.warning("Encountered %d timestamp parsing errors during range query", parse_errors)
-                
-                # Sort by timestamp
-                try:
-                    filtered_metrics.sort(key=lambda x: x["timestamp"])
-                except KeyError as err:
-                    _LOGGER.error("Error sorting metrics by timestamp: %s", err)
-                
-                _LOGGER.debug("Retrieved %d metrics in range %s to %s", len(filtered_metrics), start_time, end_time)
-                return filtered_metrics
+            await self._async_ensure_loaded_for_read()
+            metrics = self._data["metrics"]
+            
+            if not metrics:
+                _LOGGER.debug("No metrics found in storage for range query")
+                return []
+            
+            start = bisect_left(self._index_epochs, _epoch(start_time))
+            end = bisect_right(self._index_epochs, _epoch(end_time))
+            filtered_metrics = [
+                metrics[timestamp_key] for timestamp_key in self._index_keys[start:end]
+            ]
+            
+            _LOGGER.debug("Retrieved %d metrics in range %s to %s", len(filtered_metrics), start_time, end_time)
+            return filtered_metrics
                 
         except Exception as err:
             _LOGGER.error("Error retrieving metrics range: %s", err, exc_info=True)
             return []
 
-    async def _import_metrics_to_statistics(self, metrics_data: List[Dict[str, Any]]) -> None:
-        """Import metrics data to Home Assistant statistics system."""
+    async def _import_metrics_to_statistics(
+        self,
+        energy_statistics: List[Dict[str, Any]],
+        temperature_statistics: List[Dict[str, Any]],
+    ) -> None:
+        """Import prepared, time-ordered statistics rows into Home Assistant."""
         try:
-            # Prepare statistics for energy meter (cumulative)
-            energy_statistics = []
-            temperature_statistics = []
-            
-            # Sort metrics by timestamp to ensure proper order
-            def parse_timestamp_for_sorting(metric):
-                timestamp = metric.get("timestamp")
-                if isinstance(timestamp, str):
-                    return dt_util.parse_datetime(timestamp)
-                elif isinstance(timestamp, datetime):
-                    return timestamp
-                else:
-                    return datetime.min  # Put invalid timestamps at the beginning
-            
-            sorted_metrics = sorted(metrics_data, key=parse_timestamp_for_sorting)
-            
-            for metric in sorted_metrics:
-                timestamp = metric.get("timestamp")
-                if isinstance(timestamp, str):
-                    timestamp = dt_util.parse_datetime(timestamp)
-                
-                if not timestamp:
-                    continue
-                
-                # Round timestamp to the hour (Home Assistant statistics requirement)
-                timestamp = timestamp.replace(minute=0, second=0, microsecond=0)
-                
-                # Energy meter statistics (cumulative)
-                meter_value = metric.get("meter_value")
-                if meter_value is not None:
-                    energy_stat = {
-                        "start": timestamp,
-                        "sum": float(meter_value),  # Cumulative energy reading
-                        "state": float(meter_value),  # Current state
-                    }
-                    energy_statistics.append(energy_stat)
-                
-                # Temperature statistics
-                temperature = metric.get("temperature")
-                if temperature is not None:
-                    temp_stat = {
-                        "start": timestamp,
-                        "mean": float(temperature),  # Average temperature
-                        "min": float(temperature),   # Could be actual min if available
-                        "max": float(temperature),   # Could be actual max if available
-                    }
-                    temperature_statistics.append(temp_stat)
-            
             # Import energy statistics
             if energy_statistics:
-                energy_metadata = {
-                    "source": DOMAIN,
-                    "statistic_id": f"{DOMAIN}:energy_total",
-                    "unit_of_measurement": "kWh",
-                    "has_mean": False,
-                    "has_sum": True,
-                    "name": "Energy Consumption Total",
-                }
-                
                 _LOGGER.debug("Importing %d energy statistics to Home Assistant", len(energy_statistics))
-                async_add_external_statistics(self.hass, energy_metadata, energy_statistics)
+                async_add_external_statistics(self.hass, _ENERGY_METADATA, energy_statistics)
                 _LOGGER.info("Successfully imported %d energy statistics", len(energy_statistics))
             
             # Import temperature statistics
             if temperature_statistics:
-                temp_metadata = {
-                    "source": DOMAIN,
-                    "statistic_id": f"{DOMAIN}:temperature",
-                    "unit_of_measurement": "°F",
-                    "has_mean": True,
-                    "has_sum": False,
-                    "name": "Temperature",
-                }
-                
                 _LOGGER.debug("Importing %d temperature statistics to Home Assistant", len(temperature_statistics))
-                async_add_external_statistics(self.hass, temp_metadata, temperature_statistics)
+                async_add_external_statistics(self.hass, _TEMP_METADATA, temperature_statistics)
                 _LOGGER.info("Successfully imported %d temperature statistics", len(temperature_statistics))
                 
         except Exception as err:
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Mapping
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -12,6 +13,7 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfEnergy, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
@@ -21,6 +23,78 @@ from .coordinator import EnergyMetricsCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Attributes reported while there is nothing to show
+_DISCONNECTED_ATTRIBUTES = {"error": "No coordinator data", "status": "disconnected"}
+_NO_DATA_ATTRIBUTES = {"error": "No metrics data", "status": "no_data"}
+
+
+@dataclass(frozen=True, slots=True)
+class MetricSpec:
+    """Description of a sensor that reports one field of the latest metric."""
+
+    key: str
+    name: str
+    value_key: str
+    device_class: SensorDeviceClass | None
+    state_class: SensorStateClass
+    unit: str
+    display_precision: int
+    icon: str
+    # Attributes that never change while the sensor has data
+    static_attributes: Mapping[str, Any]
+    # Whether to report the reading count and the age of the latest reading
+    reading_stats: bool = False
+
+
+SENSOR_SPECS: tuple[MetricSpec, ...] = (
+    # Cumulative meter reading for the Home Assistant Energy dashboard
+    MetricSpec(
+        key="energy_meter",
+        name="Energy Meter",
+        value_key="meter_value",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        display_precision=3,
+        icon="mdi:flash",
+        static_attributes={
+            "data_source": "energy_vendor_export",
+            "status": "connected",
+        },
+        reading_stats=True,
+    ),
+    # Average consumption, reported as a generic measurement
+    MetricSpec(
+        key="energy_average",
+        name="Energy Average",
+        value_key="average_value",
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        display_precision=3,
+        icon="mdi:flash-outline",
+        static_attributes={
+            "measurement_type": "average_consumption",
+            "status": "connected",
+        },
+    ),
+    # Environmental temperature
+    MetricSpec(
+        key="temperature",
+        name="Temperature",
+        value_key="temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfTemperature.FAHRENHEIT,
+        display_precision=1,
+        icon="mdi:thermometer",
+        static_attributes={
+            "sensor_type": "environmental",
+            "status": "connected",
+        },
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -28,309 +102,97 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Energy Metrics sensors from a config entry."""
-    _LOGGER.info("Setting up Energy Metrics sensors for entry %s", config_entry.entry_id)
-    
-    try:
-        coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-        
-        entities = [
-            EnergyMeterSensor(coordinator, config_entry),
-            EnergyAverageSensor(coordinator, config_entry),
-            TemperatureSensor(coordinator, config_entry),
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    # Every sensor of an entry belongs to the same device, so they share one
+    # DeviceInfo
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, config_entry.entry_id)},
+        name="Energy Metrics Importer",
+        manufacturer="Custom Integration",
+        model="Energy Metrics",
+        sw_version="1.0.0",
+    )
+    async_add_entities(
+        [
+            EnergyMetricsSensor(coordinator, config_entry, spec, device_info)
+            for spec in SENSOR_SPECS
         ]
-        
-        _LOGGER.debug("Created %d sensor entities for entry %s", len(entities), config_entry.entry_id)
-        async_add_entities(entities)
-        _LOGGER.info("Successfully set up %d Energy Metrics sensors for entry %s", len(entities), config_entry.entry_id)
-        
-    except KeyError as err:
-        _LOGGER.error("Failed to find coordinator for entry %s: %s", config_entry.entry_id, err)
-        raise
-    except Exception as err:
-        _LOGGER.error("Error setting up Energy Metrics sensors for entry %s: %s", config_entry.entry_id, err)
-        raise
+    )
 
 
-class EnergyMetricsBaseSensor(CoordinatorEntity, SensorEntity):
-    """Base class for Energy Metrics sensors."""
+class EnergyMetricsSensor(CoordinatorEntity, SensorEntity):
+    """Sensor reporting one field of the latest energy metric."""
 
     def __init__(
         self,
         coordinator: EnergyMetricsCoordinator,
         config_entry: ConfigEntry,
-        sensor_type: str,
+        spec: MetricSpec,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-        self._sensor_type = sensor_type
-        self._attr_unique_id = f"{config_entry.entry_id}_{sensor_type}"
+        self._spec = spec
+        self._attr_unique_id = f"{config_entry.entry_id}_{spec.key}"
         self._attr_has_entity_name = True
+        self._attr_name = spec.name
+        self._attr_device_class = spec.device_class
+        self._attr_state_class = spec.state_class
+        self._attr_native_unit_of_measurement = spec.unit
+        self._attr_suggested_display_precision = spec.display_precision
+        self._attr_icon = spec.icon
+        self._attr_device_info = device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state when added to Home Assistant."""
+        await super().async_added_to_hass()
+        self._update_from_coordinator()
 
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "Energy Metrics Importer",
-            "manufacturer": "Custom Integration",
-            "model": "Energy Metrics",
-            "sw_version": "1.0.0",
-        }
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Cache the state and attributes from the coordinator data.
+
+        Home Assistant reads native_value and extra_state_attributes on every
+        state write, so both are computed in one pass over the coordinator
+        data on each update and served from the _attr_ values in between.
+        """
+        spec = self._spec
+        data = self.coordinator.data
+        if not data:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = _DISCONNECTED_ATTRIBUTES
+            return
+
+        latest_metric = self.coordinator.latest_metric
+        if latest_metric is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = (
+                {**_NO_DATA_ATTRIBUTES, "total_readings": 0}
+                if spec.reading_stats
+                else _NO_DATA_ATTRIBUTES
+            )
+            return
+
+        # Values are converted to float when the API validates them, so they
+        # are stored, and served, as floats already
+        self._attr_native_value = latest_metric.get(spec.value_key)
+
+        attributes = {**spec.static_attributes, "last_updated": latest_metric.get("timestamp")}
+
+        if spec.reading_stats:
+            attributes["total_readings"] = len(data.get("metrics", {}))
+
+            # The coordinator indexes metrics by POSIX timestamp, so the
+            # reading age needs no parsing
+            latest_epoch = self.coordinator.latest_epoch
+            if latest_epoch is not None:
+                attributes["last_reading_age_seconds"] = dt_util.utcnow().timestamp() - latest_epoch
+
+        self._attr_extra_state_attributes = attributes
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
-
-class EnergyMeterSensor(EnergyMetricsBaseSensor):
-    """Energy meter cumulative sensor for Home Assistant Energy feature."""
-
-    def __init__(
-        self,
-        coordinator: EnergyMetricsCoordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the energy meter sensor."""
-        super().__init__(coordinator, config_entry, "energy_meter")
-        self._attr_name = "Energy Meter"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_suggested_display_precision = 3
-        self._attr_icon = "mdi:flash"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        try:
-            if not self.coordinator.data:
-                _LOGGER.debug("No coordinator data available for energy meter sensor")
-                return None
-            
-            # Get the latest metric data
-            metrics = self.coordinator.data.get("metrics", {})
-            if not metrics:
-                _LOGGER.debug("No metrics data available for energy meter sensor")
-                return None
-            
-            # Get the most recent entry
-            try:
-                latest_timestamp = max(metrics.keys())
-            except ValueError:
-                _LOGGER.warning("No valid timestamps found in metrics for energy meter sensor")
-                return None
-            
-            latest_metric = metrics[latest_timestamp]
-            meter_value = latest_metric.get("meter_value")
-            
-            if meter_value is not None:
-                try:
-                    return float(meter_value)
-                except (ValueError, TypeError) as err:
-                    _LOGGER.error("Invalid meter_value type for energy meter sensor: %s (value: %s)", err, meter_value)
-                    return None
-            else:
-                _LOGGER.debug("No meter_value available in latest metric for energy meter sensor")
-                return None
-                
-        except Exception as err:
-            _LOGGER.error("Error getting native_value for energy meter sensor: %s", err)
-            return None
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any] | None:
-        """Return extra state attributes."""
-        try:
-            if not self.coordinator.data:
-                return {"error": "No coordinator data", "status": "disconnected"}
-            
-            metrics = self.coordinator.data.get("metrics", {})
-            if not metrics:
-                return {"error": "No metrics data", "status": "no_data", "total_readings": 0}
-            
-            try:
-                latest_timestamp = max(metrics.keys())
-                latest_metric = metrics[latest_timestamp]
-                
-                attributes = {
-                    "last_updated": latest_metric.get("timestamp"),
-                    "total_readings": len(metrics),
-                    "data_source": "energy_vendor_export",
-                    "status": "connected",
-                }
-                
-                # Add reading age if timestamp is available
-                if latest_metric.get("timestamp"):
-                    try:
-                        last_reading_time = dt_util.parse_datetime(latest_metric.get("timestamp"))
-                        if last_reading_time:
-                            age_seconds = (dt_util.utcnow() - last_reading_time).total_seconds()
-                            attributes["last_reading_age_seconds"] = age_seconds
-                    except Exception as parse_err:
-                        _LOGGER.debug("Could not parse timestamp for age calculation: %s", parse_err)
-                
-                return attributes
-                
-            except ValueError:
-                return {"error": "No valid timestamps", "status": "data_error", "total_readings": len(metrics)}
-                
-        except Exception as err:
-            _LOGGER.error("Error getting extra_state_attributes for energy meter sensor: %s", err)
-            return {"error": str(err), "status": "error"}
-
-
-class EnergyAverageSensor(EnergyMetricsBaseSensor):
-    """Average energy consumption sensor."""
-
-    def __init__(
-        self,
-        coordinator: EnergyMetricsCoordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the average energy sensor."""
-        super().__init__(coordinator, config_entry, "energy_average")
-        self._attr_name = "Energy Average"
-        self._attr_device_class = None  # Generic sensor for average consumption
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_suggested_display_precision = 3
-        self._attr_icon = "mdi:flash-outline"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        try:
-            if not self.coordinator.data:
-                return None
-            
-            metrics = self.coordinator.data.get("metrics", {})
-            if not metrics:
-                return None
-            
-            try:
-                latest_timestamp = max(metrics.keys())
-            except ValueError:
-                return None
-            
-            latest_metric = metrics[latest_timestamp]
-            average_value = latest_metric.get("average_value")
-            
-            if average_value is not None:
-                try:
-                    return float(average_value)
-                except (ValueError, TypeError) as err:
-                    _LOGGER.error("Invalid average_value type for energy average sensor: %s (value: %s)", err, average_value)
-                    return None
-            
-            return None
-            
-        except Exception as err:
-            _LOGGER.error("Error getting native_value for energy average sensor: %s", err)
-            return None
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any] | None:
-        """Return extra state attributes."""
-        try:
-            if not self.coordinator.data:
-                return {"error": "No coordinator data", "status": "disconnected"}
-            
-            metrics = self.coordinator.data.get("metrics", {})
-            if not metrics:
-                return {"error": "No metrics data", "status": "no_data"}
-            
-            try:
-                latest_timestamp = max(metrics.keys())
-                latest_metric = metrics[latest_timestamp]
-                
-                return {
-                    "last_updated": latest_metric.get("timestamp"),
-                    "measurement_type": "average_consumption",
-                    "status": "connected",
-                }
-            except ValueError:
-                return {"error": "No valid timestamps", "status": "data_error"}
-                
-        except Exception as err:
-            _LOGGER.error("Error getting extra_state_attributes for energy average sensor: %s", err)
-            return {"error": str(err), "status": "error"}
-
-
-class TemperatureSensor(EnergyMetricsBaseSensor):
-    """Temperature sensor for environmental data."""
-
-    def __init__(
-        self,
-        coordinator: EnergyMetricsCoordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the temperature sensor."""
-        super().__init__(coordinator, config_entry, "temperature")
-        self._attr_name = "Temperature"
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-        self._attr_suggested_display_precision = 1
-        self._attr_icon = "mdi:thermometer"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        try:
-            if not self.coordinator.data:
-                return None
-            
-            metrics = self.coordinator.data.get("metrics", {})
-            if not metrics:
-                return None
-            
-            try:
-                latest_timestamp = max(metrics.keys())
-            except ValueError:
-                return None
-            
-            latest_metric = metrics[latest_timestamp]
-            temperature = latest_metric.get("temperature")
-            
-            if temperature is not None:
-                try:
-                    return float(temperature)
-                except (ValueError, TypeError) as err:
-                    _LOGGER.error("Invalid temperature type for temperature sensor: %s (value: %s)", err, temperature)
-                    return None
-            
-            return None
-            
-        except Exception as err:
-            _LOGGER.error("Error getting native_value for temperature sensor: %s", err)
-            return None
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any] | None:
-        """Return extra state attributes."""
-        try:
-            if not self.coordinator.data:
-                return {"error": "No coordinator data", "status": "disconnected"}
-            
-            metrics = self.coordinator.data.get("metrics", {})
-            if not metrics:
-                return {"error": "No metrics data", "status": "no_data"}
-            
-            try:
-                latest_timestamp = max(metrics.keys())
-                latest_metric = metrics[latest_timestamp]
-                
-                return {
-                    "last_updated": latest_metric.get("timestamp"),
-                    "sensor_type": "environmental",
-                    "status": "connected",
-                    "unit": "°F",
-                }
-            except ValueError:
-                return {"error": "No valid timestamps", "status": "data_error"}
-                
-        except Exception as err:
-            _LOGGER.error("Error getting extra_state_attributes for temperature sensor: %s", err)
-            return {"error": str(err), "status": "error"}
\ No newline at end of file
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
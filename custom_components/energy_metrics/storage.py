@@ -0,0 +1,62 @@
+"""Storage for Energy Metrics Importer."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict
+
+from homeassistant.helpers.storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+# On-disk column name for each per-metric field
+COLUMNS = {
+    "timestamp": "timestamps",
+    "meter_value": "meter_values",
+    "average_value": "average_values",
+    "temperature": "temperatures",
+    "created_at": "created_ats",
+}
+
+
+def metrics_to_columns(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert in-memory data to the columnar on-disk layout.
+
+    Storing one list per field instead of one object per metric avoids
+    repeating every field name for every reading.
+    """
+    metrics = data.get("metrics", {}).values()
+    columns: Dict[str, Any] = {
+        column: [metric.get(field) for metric in metrics]
+        for field, column in COLUMNS.items()
+    }
+    columns["last_updated"] = data.get("last_updated")
+    return columns
+
+
+def columns_to_metrics(columns: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the columnar on-disk layout back to in-memory data."""
+    fields = list(COLUMNS)
+    count = len(columns.get("timestamps") or [])
+    rows = zip(*(columns.get(column) or [None] * count for column in COLUMNS.values()))
+    metrics = {}
+    for row in rows:
+        metric = dict(zip(fields, row))
+        metrics[metric["timestamp"]] = metric
+    return {"metrics": metrics, "last_updated": columns.get("last_updated")}
+
+
+class EnergyMetricsStore(Store):
+    """Store that migrates older metrics layouts to the current one."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Migrate stored data to the current version."""
+        if old_major_version == 1:
+            # Version 1 stored a dict of metric objects keyed by timestamp
+            _LOGGER.info(
+                "Migrating %d stored metrics to columnar storage",
+                len(old_data.get("metrics", {})),
+            )
+            old_data = metrics_to_columns(old_data)
+        return old_data